@@ -2,34 +2,42 @@
 Back-end API exposed to the Web UI via pywebview.
 
 All methods return plain strings or JSON-serialisable objects so the
-JavaScript side can use them directly.
+JavaScript side can use them directly. ``webview`` is imported only by the
+methods that talk to the window, so the conversion API can be driven
+without pywebview installed.
 """
 from pathlib import Path
 from typing import Optional
-import webview
-from wpd_to_docx import ensure_soffice, walk_and_convert
+from wpd_to_docx import ensure_soffice, find_wpd_files, walk_and_convert
 
 
 class API:
+    def __init__(self):
+        # .wpd files found by get_file_count(), keyed by (source, recursive),
+        # so the conversion that follows doesn't walk the tree again.
+        self._scan_cache = {}
+        self._win = None
+
     # -------- file-dialog helpers -------------------------------------------
-    def choose_file(self) -> Optional[str]:
-        paths = webview.windows[0].create_file_dialog(
-            webview.OPEN_DIALOG,
-            allow_multiple=False
-        )
+    def _window(self):
+        """The pywebview window, looked up once (it doesn't exist yet in __init__)."""
+        if self._win is None:
+            import webview
+            self._win = webview.windows[0]
+        return self._win
+
+    def _dialog(self, dialog_type: str, **kwargs) -> Optional[str]:
+        import webview
+        paths = self._window().create_file_dialog(getattr(webview, dialog_type), **kwargs)
         return paths[0] if paths else None
 
+    def choose_file(self) -> Optional[str]:
+        return self._dialog("OPEN_DIALOG", allow_multiple=False)
+
     def choose_folder(self) -> Optional[str]:
-        paths = webview.windows[0].create_file_dialog(
-            webview.FOLDER_DIALOG
-        )
-        return paths[0] if paths else None
+        return self._dialog("FOLDER_DIALOG")
 
-    def choose_dest(self) -> Optional[str]:
-        paths = webview.windows[0].create_file_dialog(
-            webview.FOLDER_DIALOG
-        )
-        return paths[0] if paths else None
+    choose_dest = choose_folder
 
     # -------- conversion logic ----------------------------------------------
     def get_file_count(self, src_path: str, opts: dict) -> int:
@@ -44,8 +52,9 @@ class API:
             if src.is_file() and src.suffix.lower() == ".wpd":
                 return 1
             elif src.is_dir():
-                finder = src.rglob if recursive else src.glob
-                return sum(1 for _ in finder("*.wpd"))
+                files = list(find_wpd_files(src, recursive))
+                self._scan_cache[(str(src), recursive)] = files
+                return len(files)
             else:
                 return 0
         except Exception:
@@ -55,9 +64,11 @@ class API:
         """
         Convert files with real-time progress updates pushed to JS via evaluate_js().
         prefetched_total: count already obtained by JS; if > 0 skips the counting pass.
+        The file list scanned by get_file_count() is reused rather than re-walked.
         """
         try:
             ensure_soffice()
+            window = self._window()
 
             # Parse options
             recursive = bool(opts.get("recursive"))
@@ -65,13 +76,23 @@ class API:
             dest_root = Path(opts.get("destPath", "")).expanduser() if dest_type == "custom" else None
             organize = dest_type == "converted"
             preserve = bool(opts.get("preserve", False))
+            force = bool(opts.get("force", False))
 
             src = Path(src_path).expanduser()
+            files = self._scan_cache.pop((str(src), recursive), None)
+
+            last_pct = -1
 
-            def progress_callback(done, total):
+            def progress_callback(done, total, failed):
+                # evaluate_js blocks on a round trip to the page, so only push
+                # when the whole-number percentage moves (at most ~100 calls).
+                nonlocal last_pct
                 pct = round((done / total) * 100, 1)
-                webview.windows[0].evaluate_js(
-                    f"window.onProgressUpdate({done}, {total}, {pct})"
+                if int(pct) == last_pct and done < total:
+                    return
+                last_pct = int(pct)
+                window.evaluate_js(
+                    f"window.onProgressUpdate({done}, {total}, {pct}, {failed})"
                 )
 
             stats = walk_and_convert(
@@ -82,12 +103,16 @@ class API:
                 recursive=recursive,
                 progress_callback=progress_callback,
                 known_total=prefetched_total,
+                files=files,
+                force=force,
             )
 
             if stats['total'] > 0:
                 result_lines = ["Conversion completed!"]
                 result_lines.append(f"Total files processed: {stats['total']}")
                 result_lines.append(f"Successfully converted: {stats['successful']}")
+                if stats['skipped'] > 0:
+                    result_lines.append(f"Skipped (up to date): {stats['skipped']}")
                 if stats['failed'] > 0:
                     result_lines.append(f"Failed conversions: {stats['failed']}")
 
@@ -112,6 +137,8 @@ class API:
                 "stats": {"total": 0, "successful": 0, "failed": 0, "skipped": 0},
                 "progress": 100
             }
+        finally:
+            self._scan_cache.clear()
 
     def convert(self, src_path: str, opts: dict) -> dict:
         """
@@ -121,6 +148,7 @@ class API:
                     - destType: "same"|"converted"|"custom"
                     - destPath: str (empty if not custom)
                     - preserve: bool
+                    - force: bool (reconvert up-to-date files)
         Returns  : dict with conversion statistics and results
         """
         try:
@@ -132,16 +160,23 @@ class API:
             dest_root = Path(opts.get("destPath", "")).expanduser() if dest_type == "custom" else None
             organize = dest_type == "converted"
             preserve = bool(opts.get("preserve", False))
+            force = bool(opts.get("force", False))
 
             src = Path(src_path).expanduser()
 
+            # Scan once and hand the result over, instead of letting
+            # walk_and_convert walk the tree a second time just to count it
+            files = list(find_wpd_files(src, recursive)) if src.is_dir() else None
+
             # Use the enhanced walk_and_convert function
             stats = walk_and_convert(
                 src, 
                 organize=organize, 
                 dest_folder=dest_root, 
                 retain_structure=preserve, 
-                recursive=recursive
+                recursive=recursive,
+                files=files,
+                force=force,
             )
 
             # Create a detailed result message
@@ -149,6 +184,8 @@ class API:
                 result_lines = [f"Conversion completed!"]
                 result_lines.append(f"Total files processed: {stats['total']}")
                 result_lines.append(f"Successfully converted: {stats['successful']}")
+                if stats['skipped'] > 0:
+                    result_lines.append(f"Skipped (up to date): {stats['skipped']}")
                 if stats['failed'] > 0:
                     result_lines.append(f"Failed conversions: {stats['failed']}")
                 
@@ -0,0 +1,122 @@
+"""
+Persistent LibreOffice listener driven through the python-uno bridge.
+
+Starting soffice costs far more than converting a typical .wpd, so when
+the ``uno`` module is importable (it ships with LibreOffice's own Python
+and with distro packages such as ``python3-uno``) the converter keeps a
+headless soffice running and asks it to load and store each document,
+instead of spawning a new process per batch. Without ``uno`` callers
+fall back to the plain ``soffice --convert-to`` subprocess path.
+"""
+import atexit, shutil, socket, subprocess, tempfile, time
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:  # python-uno isn't available for this interpreter
+    uno = None
+
+CONNECT_TIMEOUT = 30  # seconds to wait for a new listener to accept connections
+DOCX_FILTER = "MS Word 2007 XML"
+
+
+def available() -> bool:
+    """True if python-uno can be imported, i.e. SofficeServer can be used."""
+    return uno is not None
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _props(**kwargs) -> tuple:
+    return tuple(PropertyValue(name, 0, value, 0) for name, value in kwargs.items())
+
+
+class SofficeServer:
+    """
+    One headless soffice listening on a private localhost port, with its
+    own user profile so several servers can run side by side.
+    """
+
+    def __init__(self, soffice: str):
+        self.port = _free_port()
+        self.profile = Path(tempfile.mkdtemp(prefix="lo_server_"))
+        self.process = subprocess.Popen(
+            [
+                soffice,
+                f"-env:UserInstallation={self.profile.as_uri()}",
+                "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+                f"--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._closed = False
+        self.killed = False
+        self.desktop = None
+        atexit.register(self.close)
+        self.desktop = self._connect()
+
+    def _connect(self):
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        url = f"uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + CONNECT_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(url)
+                break
+            except Exception:  # NoConnectException until soffice is listening
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.close()
+                    raise RuntimeError("LibreOffice listener did not start")
+                time.sleep(0.1)
+        return ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+    def running(self) -> bool:
+        return not self._closed and self.process.poll() is None
+
+    def convert(self, wpd: Path, output_file: Path) -> None:
+        """Convert ``wpd`` to ``output_file`` (.docx); raises on failure."""
+        doc = self.desktop.loadComponentFromURL(
+            wpd.resolve().as_uri(), "_blank", 0, _props(Hidden=True)
+        )
+        if doc is None:
+            raise RuntimeError("source file could not be loaded")
+        try:
+            doc.storeToURL(output_file.resolve().as_uri(), _props(FilterName=DOCX_FILTER))
+        finally:
+            doc.close(True)
+
+    def kill(self) -> None:
+        """
+        Kill soffice at once, e.g. from a watchdog when a document hangs it.
+        A call blocked in convert() then fails and running() turns False;
+        close() still removes the profile.
+        """
+        self.killed = True
+        if self.process.poll() is None:
+            self.process.kill()
+
+    def close(self) -> None:
+        """Shut the listener down and remove its profile. Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.process.poll() is None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        shutil.rmtree(self.profile, ignore_errors=True)
@@ -9,6 +9,7 @@ api.py and wpd_to_docx.py.
 from pathlib import Path
 import webview
 from api import API
+from wpd_to_docx import warm_soffice
 
 
 def main() -> None:
@@ -24,6 +25,8 @@ def main() -> None:
         height=720,
         resizable=False,
     )
+    # Fault LibreOffice into the page cache while the user picks files
+    warm_soffice()
     webview.start()
 
 
@@ -12,66 +12,145 @@ $ python wpd_to_docx.py /path/to/folder --recursive  # search sub-folders recurs
 $ python wpd_to_docx.py /path/to/folder --organize  # place files in 'Converted' subfolder
 $ python wpd_to_docx.py /path/to/folder --dest /path/to/destination  # custom destination
 $ python wpd_to_docx.py /path/to/folder --dest /path/to/destination --retain-structure  # keep folder structure
+$ python wpd_to_docx.py /path/to/folder --jobs 4  # number of parallel LibreOffice workers
+$ python wpd_to_docx.py /path/to/folder --force  # reconvert even if the .docx is up to date
+
+Performance model
+-----------------
+The work is I/O- and process-bound: each batch spends nearly all of its
+wall time waiting on soffice, which itself mostly reads the .wpd, builds
+the document model and writes the .docx. Python-side CPU is negligible,
+so speed-ups come from doing less work (skipping up-to-date outputs,
+batching files per soffice call), overlapping work (worker threads) and
+cutting fixed per-file overhead (a persistent UNO listener, no captured
+stdout) -- not from optimising Python code in the conversion path.
+Set WPD_TIMING=1 to print wall and Python CPU time per batch and check
+that this still holds.
 """
-import subprocess, sys, shutil, threading, os, tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse, json, subprocess, sys, shutil, threading, os, tempfile, queue, time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import Optional
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from tkinter import ttk
+import soffice_server
 
 MAX_WORKERS = min(8, os.cpu_count() or 1)
+BATCH_SIZE = 16  # max .wpd files handed to one soffice invocation
+TIMEOUT_PER_FILE = 60  # seconds allowed per file in a batch...
+TIMEOUT_BYTES_PER_SECOND = 200 * 1024  # ...or longer for very large files
+STALL_POLL = 1  # seconds between output checks while a batch runs
+BATCH_ARGV_CHARS = 24000  # stay well under Windows' 32767-char command line
+REPORT_EVERY = 64  # skipped files printed (and progress pushed) together
+SKIPPED = "skipped"  # convert_* result for files whose .docx is already up to date
+# Per output folder: {source path: [mtime_ns, size]} of each .wpd converted
+# there, so a re-run can tell an unchanged source from a stat alone.
+PROVENANCE_FILE = ".wpd_converted.json"
+# soffice arguments between the profile and the output folder; fixed for every batch
+CONVERT_ARGS = ("--headless", "--convert-to", "docx", "--outdir")
+# On POSIX, CPython only starts children with posix_spawn (no copy of the
+# parent's page tables, which matters in the GUI processes) when close_fds
+# is False. Python's own descriptors are non-inheritable (PEP 446), so
+# soffice still receives only its standard streams.
+_CLOSE_FDS = os.name != "posix"
+TIMING = bool(os.environ.get("WPD_TIMING"))  # print per-batch wall/CPU time
+
+# LibreOffice executable; located on first use by find_soffice()
+SOFFICE = None
+
+# Output directories already created during the current walk_and_convert run
+_created_dirs: set[Path] = set()
+_created_dirs_lock = threading.Lock()
+
+# Running SofficeServers not currently used by a worker. They are kept
+# between runs so the GUI apps start LibreOffice once per session rather
+# than once per conversion; SofficeServer shuts each one down at exit.
+_idle_servers: list = []
+_idle_servers_lock = threading.Lock()
+_listener_failed = False
+
+# Default install locations probed when soffice isn't on PATH
+SOFFICE_CANDIDATES = (
+    # macOS paths
+    Path("/Applications/LibreOffice.app/Contents/MacOS/soffice"),
+    Path("/opt/homebrew/bin/soffice"),  # Homebrew on Apple Silicon
+    Path("/usr/local/bin/soffice"),     # Homebrew on Intel
+
+    # Windows paths
+    # Standard installation paths
+    Path("C:/Program Files/LibreOffice/program/soffice.exe"),
+    Path("C:/Program Files (x86)/LibreOffice/program/soffice.exe"),
+
+    # User-specific installations
+    Path(f"{Path.home()}/AppData/Local/Programs/LibreOffice/program/soffice.exe"),
+    Path(f"{Path.home()}/AppData/Roaming/LibreOffice/program/soffice.exe"),
+
+    # Microsoft Store version
+    Path(f"{Path.home()}/AppData/Local/Microsoft/WindowsApps/soffice.exe"),
+
+    # Portable installations
+    Path("C:/LibreOffice/program/soffice.exe"),
+    Path("D:/LibreOffice/program/soffice.exe"),
+
+    # Linux paths (distro packages, when /usr/bin isn't on PATH)
+    Path("/usr/bin/soffice"),
+    Path("/usr/lib/libreoffice/program/soffice"),
+    Path("/usr/lib64/libreoffice/program/soffice"),
+    Path("/opt/libreoffice/program/soffice"),
+)
+
+# Remembers where LibreOffice was found, across sessions
+SOFFICE_CACHE = Path.home() / ".wp_converter_soffice_path"
+
+def find_soffice() -> Optional[str]:
+    """
+    Return the LibreOffice binary, or None if it can't be found.
+
+    A hit is remembered in the global ``SOFFICE`` so later calls don't touch
+    the filesystem, and in SOFFICE_CACHE for later sessions; a miss is not,
+    so a fresh install is picked up on retry.
+    """
+    global SOFFICE
+    if SOFFICE:  # already found by an earlier call
+        return SOFFICE
+
+    # A location found by an earlier session is trusted if it still exists,
+    # so a launch normally costs one probe instead of a PATH and install scan.
+    try:
+        found = SOFFICE_CACHE.read_text(encoding="utf-8").strip()
+    except OSError:
+        found = None
+    if found and os.path.exists(found):
+        SOFFICE = found
+        return SOFFICE
+
+    # Try to find LibreOffice executable on PATH
+    found = shutil.which("soffice")
+    if not found and sys.platform == "win32":
+        # On Windows, also try with .exe extension explicitly
+        found = shutil.which("soffice.exe")
 
-# Try to find LibreOffice executable on PATH
-SOFFICE = shutil.which("soffice")
-if not SOFFICE and sys.platform == "win32":
-    # On Windows, also try with .exe extension explicitly
-    SOFFICE = shutil.which("soffice.exe")
+    if not found:
+        for path in SOFFICE_CANDIDATES:
+            if path.exists():
+                found = str(path)
+                break
+
+    if found:
+        try:
+            SOFFICE_CACHE.write_text(found, encoding="utf-8")
+        except OSError:
+            pass  # read-only home: just search again next time
+    SOFFICE = found
+    return SOFFICE
 
 def ensure_soffice():
     """
     Make sure the global ``SOFFICE`` variable points to a LibreOffice
     binary. First tries whatever is on PATH, then falls back to the
-    default install locations for macOS and Windows.
+    default install locations for macOS, Windows and Linux.
     """
-    global SOFFICE
-    if SOFFICE:  # already found via shutil.which
+    if find_soffice():
         return
     
-    # Try common installation paths
-    possible_paths = []
-    
-    # macOS paths
-    possible_paths.extend([
-        Path("/Applications/LibreOffice.app/Contents/MacOS/soffice"),
-        Path("/opt/homebrew/bin/soffice"),  # Homebrew on Apple Silicon
-        Path("/usr/local/bin/soffice"),     # Homebrew on Intel
-    ])
-    
-    # Windows paths
-    possible_paths.extend([
-        # Standard installation paths
-        Path("C:/Program Files/LibreOffice/program/soffice.exe"),
-        Path("C:/Program Files (x86)/LibreOffice/program/soffice.exe"),
-        
-        # User-specific installations
-        Path(f"{Path.home()}/AppData/Local/Programs/LibreOffice/program/soffice.exe"),
-        Path(f"{Path.home()}/AppData/Roaming/LibreOffice/program/soffice.exe"),
-        
-        # Microsoft Store version
-        Path(f"{Path.home()}/AppData/Local/Microsoft/WindowsApps/soffice.exe"),
-        
-        # Portable installations
-        Path("C:/LibreOffice/program/soffice.exe"),
-        Path("D:/LibreOffice/program/soffice.exe"),
-    ])
-    
-    for path in possible_paths:
-        if path.exists():
-            SOFFICE = str(path)
-            return
-    
     # If we get here, LibreOffice wasn't found
     install_msg = "LibreOffice is required but was not found.\n\n"
     
@@ -93,103 +172,458 @@ def ensure_soffice():
     
     sys.exit(install_msg)
 
+def warm_soffice():
+    """
+    Run ``soffice --version`` on a background thread so LibreOffice's
+    binaries and libraries are already in the OS page cache when the first
+    real conversion starts. Does nothing if LibreOffice can't be found.
+    """
+    soffice = find_soffice()
+    if not soffice:
+        return
+
+    def run():
+        lo_profile = Path(tempfile.mkdtemp(prefix="lo_warm_"))
+        try:
+            subprocess.run(
+                [soffice, f"-env:UserInstallation={lo_profile.as_uri()}", "--headless", "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60,
+            )
+        except (OSError, subprocess.SubprocessError):
+            pass  # warming is best effort; the real conversion reports errors
+        finally:
+            shutil.rmtree(lo_profile, ignore_errors=True)
+
+    threading.Thread(target=run, daemon=True).start()
+
+_print_lock = threading.Lock()
+
+def _report(wpd: Path, status: str):
+    """Print one per-file status line without interleaving across workers."""
+    with _print_lock:
+        print(f"→ {wpd.name}  {status}")
+
+def _report_all(entries: list):
+    """
+    Print the (wpd, status) pairs collected for a batch with one write, so
+    workers take the console lock once per batch instead of once per file.
+    """
+    if entries:
+        text = "".join(f"→ {os.path.basename(wpd)}  {status}\n" for wpd, status in entries)
+        with _print_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+def _checkout_server() -> Optional[soffice_server.SofficeServer]:
+    """
+    Take an idle SofficeServer, starting a new one if none is free. Returns
+    None when python-uno isn't available or a listener has failed to start.
+    """
+    global _listener_failed
+    if _listener_failed or not soffice_server.available():
+        return None
+    with _idle_servers_lock:
+        while _idle_servers:
+            server = _idle_servers.pop()
+            if server.running():
+                return server
+    try:
+        return soffice_server.SofficeServer(SOFFICE)
+    except Exception as e:
+        _listener_failed = True
+        print(f"LibreOffice listener unavailable ({e}); using soffice --convert-to")
+        return None
+
+def _checkin_server(server: soffice_server.SofficeServer):
+    """Return a server taken with _checkout_server() to the idle pool."""
+    if server.running():
+        with _idle_servers_lock:
+            _idle_servers.append(server)
+
+def _make_output_dir(out_dir: Path) -> Optional[str]:
+    """
+    Create ``out_dir`` unless this run already has; returns an error
+    message if it can't be created. Checked again under the lock so
+    threads racing on a new folder don't all issue the same mkdir chain.
+    """
+    if out_dir in _created_dirs:
+        return None
+    with _created_dirs_lock:
+        if out_dir not in _created_dirs:
+            try:
+                out_dir.mkdir(exist_ok=True, parents=True)
+            except PermissionError:
+                return "permission denied creating output directory"
+            except OSError as e:
+                return f"cannot create output directory: {e}"
+            _created_dirs.add(out_dir)
+    return None
+
+def _mtime(path) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+# macOS and Windows volumes are case-insensitive by default, so a.docx and
+# A.docx name the same file there; elsewhere they are two different files.
+_FOLD_CASE = sys.platform in ("darwin", "win32")
+
+def _name_key(name: str) -> str:
+    """``name`` as the output folder's filesystem compares it."""
+    return name.lower() if _FOLD_CASE else name
+
+def _existing_docx(out_dir: Path) -> set:
+    """
+    _name_key()s of the .docx files already in ``out_dir``, from one
+    listing, so files with no output yet need no stat of their own.
+    """
+    try:
+        with os.scandir(out_dir) as it:
+            return {_name_key(e.name) for e in it if e.name[-5:].lower() == ".docx"}
+    except OSError:
+        return set()
+
+def _size(path) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0  # soffice reports the missing file itself
+
+def _batch_timeout(sizes) -> int:
+    """
+    Seconds a soffice run over files of these byte ``sizes`` may take:
+    TIMEOUT_PER_FILE for each file, or more for files large enough to need
+    longer at TIMEOUT_BYTES_PER_SECOND.
+    """
+    return sum(max(TIMEOUT_PER_FILE, size // TIMEOUT_BYTES_PER_SECOND) for size in sizes)
+
+def _load_provenance(out_dir) -> dict:
+    try:
+        with open(os.path.join(out_dir, PROVENANCE_FILE), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _save_provenance(out_dir, data: dict):
+    """Replace ``out_dir``'s PROVENANCE_FILE atomically; failures are ignored."""
+    path = os.path.join(out_dir, PROVENANCE_FILE)
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass  # next run falls back to comparing modification times
+
+def _up_to_date(wpd, out_mtime: Optional[float]) -> bool:
+    """True if a .docx last modified at ``out_mtime`` is at least as new as ``wpd``."""
+    return out_mtime is not None and out_mtime >= (_mtime(wpd) or 0)
+
+def output_dir_for(
+    wpd: Path,
+    organize: bool = False,
+    dest_folder: Optional[Path] = None,
+    retain_structure: bool = False,
+    src_root: Optional[Path] = None,
+) -> Path:
+    """Return the folder the converted .docx for ``wpd`` should be written to."""
+    if dest_folder:
+        if retain_structure and src_root:
+            # Preserve full relative path from the original source root
+            return dest_folder / wpd.parent.relative_to(src_root)
+        return dest_folder
+    # Original behavior: same folder or "Converted" subfolder
+    return (wpd.parent / "Converted") if organize else wpd.parent
+
+def convert_batch(
+    out_dir: Path,
+    wpds: list,
+    lo_profile: Optional[Path] = None,
+    server: Optional[soffice_server.SofficeServer] = None,
+    force: bool = False,
+    sizes: Optional[list] = None,
+) -> list:
+    """
+    Convert several .wpd files that share an output directory with a
+    single soffice invocation, so LibreOffice start-up is paid once per
+    batch instead of once per file.
+
+    lo_profile: LibreOffice user profile directory to run with. When omitted
+    a throwaway profile is created for this call and removed afterwards.
+    server: a running SofficeServer; when given, documents are converted
+    through it and no soffice process is spawned at all.
+    force: convert even when the existing .docx is up to date.
+    sizes: byte sizes of ``wpds``, when the caller has already stat'd them,
+    used to size the timeouts; otherwise each file is stat'd here.
+
+    Returns a list parallel to ``wpds`` holding True (converted), SKIPPED
+    (the .docx is at least as new as the .wpd) or False (failed) for each file.
+    """
+    log = []  # (wpd, status) lines, printed together when the batch is done
+    if TIMING:
+        wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        if sizes is None:
+            sizes = [_size(wpd) for wpd in wpds]
+        return _convert_batch(out_dir, wpds, lo_profile, server, force, sizes, log)
+    finally:
+        _report_all(log)
+        if TIMING:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            with _print_lock:
+                print(
+                    f"[timing] {len(wpds)} file(s) → {out_dir}: wall {wall:.2f}s, "
+                    f"python cpu {cpu:.3f}s ({cpu / max(wall, 1e-9):.1%})",
+                    file=sys.stderr, flush=True,
+                )
+
+def _convert_batch(out_dir, wpds, lo_profile, server, force, sizes, log) -> list:
+    results = [False] * len(wpds)
+
+    # Create output directory with error handling
+    error = _make_output_dir(out_dir)
+    if error:
+        for wpd in wpds:
+            log.append((wpd, f"failed - {error}"))
+        return results
+
+    # Skip files whose output is up to date; stale outputs are reconverted.
+    # The old mtime is kept so a stale file isn't mistaken for fresh output.
+    pending = []
+    old_mtimes = {}
+    for i, wpd in enumerate(wpds):
+        out_mtime = _mtime(out_dir / f"{wpd.stem}.docx")
+        if not force and _up_to_date(wpd, out_mtime):
+            log.append((wpd, "skipped - output file is up to date"))
+            results[i] = SKIPPED
+        else:
+            pending.append(i)
+            old_mtimes[i] = out_mtime
+    if not pending:
+        return results
+
+    if server is not None:
+        for n, i in enumerate(pending):
+            if not server.running():
+                # The listener died (typically a document crashed it); the
+                # rest of the batch goes through soffice --convert-to below.
+                pending = pending[n:]
+                break
+            wpd = wpds[i]
+            # UNO calls block for as long as LibreOffice takes, so a hung
+            # document would stall this worker for good. Past the budget the
+            # subprocess path allows, the listener is killed: the call fails
+            # and the loop above sends the rest of the batch to soffice.
+            watchdog = threading.Timer(_batch_timeout([sizes[i]]), server.kill)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                server.convert(wpd, out_dir / f"{wpd.stem}.docx")
+            except Exception as e:
+                log.append((wpd, f"failed - {'conversion timeout' if server.killed else e}"))
+            else:
+                log.append((wpd, "✓"))
+                results[i] = True
+            finally:
+                watchdog.cancel()
+        else:
+            return results
+
+    # Each worker uses its own LibreOffice user profile so parallel workers
+    # don't collide on the shared ~/.config/libreoffice lock.
+    own_profile = lo_profile is None
+    if own_profile:
+        lo_profile = Path(tempfile.mkdtemp(prefix="lo_worker_"))
+
+    def converted(i):
+        out_mtime = _mtime(out_dir / f"{wpds[i].stem}.docx")
+        return out_mtime is not None and out_mtime != old_mtimes[i]
+
+    errors = {}
+    try:
+        # A batch may run for the sum of its files' budgets, but only as long
+        # as outputs keep appearing: one document that hangs soffice ends the
+        # run after its own budget, not the whole batch's, and the retries
+        # below get the full per-file budget.
+        error_msg = _run_soffice(
+            out_dir, [wpds[i] for i in pending], lo_profile,
+            _batch_timeout(sizes[i] for i in pending),
+            stall=max(_batch_timeout([sizes[i]]) for i in pending),
+            progress=lambda: sum(converted(i) for i in pending),
+        )
+        if error_msg and len(pending) > 1:
+            # A document that crashes or hangs soffice takes the rest of the
+            # run down with it, so every file left without new output is
+            # retried on its own and only a file that fails alone is failed.
+            for i in pending:
+                if not converted(i):
+                    errors[i] = _run_soffice(out_dir, [wpds[i]], lo_profile, _batch_timeout([sizes[i]]))
+    finally:
+        if own_profile:
+            shutil.rmtree(lo_profile, ignore_errors=True)
+
+    # soffice exits 0 even when individual inputs fail to load, so verify
+    # each output file was (re)written rather than trusting the return code.
+    for i in pending:
+        wpd = wpds[i]
+        if converted(i):
+            log.append((wpd, "✓"))
+            results[i] = True
+        else:
+            log.append((wpd, f"failed - {errors.get(i, error_msg) or 'output file not created'}"))
+    return results
+
+def _run_soffice(
+    out_dir: Path,
+    wpds: list,
+    lo_profile: Path,
+    timeout: int,
+    stall: Optional[int] = None,
+    progress=None,
+) -> Optional[str]:
+    """
+    Run one ``soffice --convert-to docx`` over ``wpds``. Returns an error
+    message if soffice failed, timed out or couldn't be started, else None.
+
+    With ``progress`` (a callable counting the outputs written so far) the
+    run also times out once that count hasn't changed for ``stall`` seconds.
+    """
+    cmd = [
+        SOFFICE,
+        f"-env:UserInstallation={lo_profile.as_uri()}",
+        *CONVERT_ARGS,
+        os.fspath(out_dir),
+        *[os.fspath(wpd) for wpd in wpds],
+    ]
+    try:
+        # soffice's stdout is only "convert a -> b" chatter: discard it in
+        # the kernel, and decode stderr only when the run failed.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=_CLOSE_FDS,
+        )
+    except FileNotFoundError:
+        return "LibreOffice not found"
+    with proc:
+        start = time.monotonic()
+        deadline = start + timeout
+        seen, quiet_since = (progress(), start) if progress else (None, None)
+        try:
+            while True:
+                wait_for = deadline - time.monotonic()
+                if progress:
+                    wait_for = min(wait_for, STALL_POLL)
+                try:
+                    _, stderr = proc.communicate(timeout=max(0, wait_for))
+                    break
+                except subprocess.TimeoutExpired:
+                    now = time.monotonic()
+                    if now >= deadline or not progress:
+                        raise
+                    count = progress()
+                    if count != seen:
+                        seen, quiet_since = count, now
+                    elif now - quiet_since >= stall:
+                        raise
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            # A killed soffice can leave a stale lock behind, so the profile is
+            # emptied; LibreOffice sets it up again on its next start.
+            shutil.rmtree(lo_profile, ignore_errors=True)
+            lo_profile.mkdir(exist_ok=True)
+            return "conversion timeout"
+    if proc.returncode:
+        # The message is repeated on every file of the batch, so keep
+        # just the last line (LibreOffice's actual error) of stderr.
+        lines = stderr.decode("utf-8", "replace").strip().splitlines()
+        return lines[-1].strip() if lines else "unknown error"
+    return None
+
 def convert_file(
     wpd: Path,
     organize: bool = False,
     dest_folder: Optional[Path] = None,
     retain_structure: bool = False,
     src_root: Optional[Path] = None,
+    force: bool = False,
 ):
-    print(f"→ {wpd.name}", end="  ")
-    
     try:
-        # Check if source file exists and is readable
-        if not wpd.exists():
-            print("failed - file not found")
-            return False
-        
+        # Check that the source is an existing regular file; the second
+        # stat is only paid when it isn't, to tell the two errors apart.
         if not wpd.is_file():
-            print("failed - not a file")
+            _report(wpd, "failed - file not found" if not wpd.exists() else "failed - not a file")
             return False
-        
+
         # Validate file extension
         if wpd.suffix.lower() != ".wpd":
-            print("failed - not a .wpd file")
-            return False
-        
-        # Determine output directory
-        if dest_folder:
-            if retain_structure and src_root:
-                # Preserve full relative path from the original source root
-                rel_path = wpd.parent.relative_to(src_root)
-                out_dir = dest_folder / rel_path
-            else:
-                out_dir = dest_folder
-        else:
-            # Original behavior: same folder or "Converted" subfolder
-            out_dir = (wpd.parent / "Converted") if organize else wpd.parent
-        
-        # Create output directory with error handling
-        try:
-            out_dir.mkdir(exist_ok=True, parents=True)
-        except PermissionError:
-            print("failed - permission denied creating output directory")
+            _report(wpd, "failed - not a .wpd file")
             return False
-        except OSError as e:
-            print(f"failed - cannot create output directory: {e}")
-            return False
-        
-        # Check if output file already exists
-        output_file = out_dir / f"{wpd.stem}.docx"
-        if output_file.exists():
-            print("skipped - output file already exists")
-            return True
-        
-        # Each call gets its own LibreOffice user profile so parallel workers
-        # don't collide on the shared ~/.config/libreoffice lock.
-        lo_profile = Path(tempfile.mkdtemp(prefix="lo_worker_"))
-        try:
-            cmd = [
-                SOFFICE,
-                f"-env:UserInstallation={lo_profile.as_uri()}",
-                "--headless", "--convert-to", "docx",
-                "--outdir", str(out_dir), str(wpd)
-            ]
 
-            try:
-                res = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    timeout=60  # 60 second timeout
-                )
-            except subprocess.TimeoutExpired:
-                print("failed - conversion timeout")
-                return False
-            except FileNotFoundError:
-                print("failed - LibreOffice not found")
-                return False
+        out_dir = output_dir_for(wpd, organize, dest_folder, retain_structure, src_root)
+        server = _checkout_server()
+        try:
+            return convert_batch(out_dir, [wpd], server=server, force=force)[0]
         finally:
-            shutil.rmtree(lo_profile, ignore_errors=True)
-        
-        if res.returncode:
-            error_msg = res.stdout.strip() if res.stdout.strip() else "unknown error"
-            print(f"failed - {error_msg}")
-            return False
-        else:
-            # Verify the output file was created
-            if output_file.exists():
-                print("✓")
-                return True
-            else:
-                print("failed - output file not created")
-                return False
-                
+            if server:
+                _checkin_server(server)
+
     except Exception as e:
-        print(f"failed - unexpected error: {e}")
+        _report(wpd, f"failed - unexpected error: {e}")
         return False
 
+# DirEntry.inode() comes free with the listing on POSIX but costs a stat
+# per file on Windows, where it also says little about disk layout.
+_SORT_BY_INODE = sys.platform != "win32"
+
+def _iter_wpd(root, recursive: bool):
+    """
+    Walk ``root`` with os.scandir. DirEntry.is_file()/is_dir() are answered
+    from the directory listing itself, so unlike Path.rglob no extra stat
+    call or intermediate Path object is needed per entry. Matches are
+    yielded as plain path strings; find_wpd_files() wraps them in Path.
+
+    Folders are visited from an explicit stack rather than by nested
+    generators, so a file found N levels deep isn't passed up through N
+    ``yield from`` frames and deep trees can't hit the recursion limit.
+    """
+    stack = [root]
+    while stack:
+        # A folder's own files are all yielded before any of its sub-folders
+        # are entered, so files sharing an output directory arrive together
+        # and fill whole soffice batches; the listing is closed before moving on.
+        found, subdirs = [], []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # Test the name first: it's a plain string slice, while
+                    # is_file() can cost a stat on filesystems that don't report
+                    # the entry type. Only the suffix is lowercased.
+                    if entry.name[-4:].lower() == ".wpd" and entry.is_file():
+                        found.append(entry)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            # Unreadable or vanished folders are skipped, as Path.rglob does
+            continue
+        if _SORT_BY_INODE:
+            # Inode order roughly follows on-disk layout, so soffice reads
+            # a folder's files with fewer seeks than in listing order.
+            found.sort(key=os.DirEntry.inode)
+        for entry in found:
+            yield entry.path
+        # Reversed so sub-folders are still visited in listing order
+        stack.extend(reversed(subdirs))
+
+def find_wpd_files(path: Path, recursive: bool = True):
+    """Yield the .wpd files (any case of extension) inside the directory ``path``."""
+    return map(Path, _iter_wpd(path, recursive))
+
 def walk_and_convert(
     path: Path,
     organize: bool = False,
@@ -200,63 +634,313 @@ def walk_and_convert(
     progress_callback=None,
     max_workers: int = MAX_WORKERS,
     known_total: int = 0,
+    files: Optional[list] = None,
+    force: bool = False,
+    cancel: Optional[threading.Event] = None,
 ):
     """
     Convert WPD files and return conversion statistics.
 
-    progress_callback(done: int, total: int) is called after each file completes.
+    Files bound for the same output directory are grouped into batches of
+    up to BATCH_SIZE and each batch is converted by one soffice process.
+    Files whose .docx is already up to date are counted as skipped while
+    the batches are formed and never reach a worker. A file counts as up to
+    date when its mtime and size match what the output folder's
+    PROVENANCE_FILE recorded at its last conversion or, for files with no
+    record, when the .docx is at least as new as the .wpd.
+
+    progress_callback(done: int, total: int, failed: int) is called after each
+        batch completes; ``failed`` is the running count of failed files.
     known_total: if > 0, skip the counting pass and use this value instead.
+    files: .wpd files already found under ``path``; when given the tree is
+        not walked at all and ``known_total`` defaults to ``len(files)``.
+    force: reconvert files whose .docx is already up to date.
+    cancel: once this event is set the walk stops, no further batches are
+        submitted and queued ones are dropped; batches already running
+        finish and the statistics so far are returned.
 
     Returns:
         dict: Statistics with 'total', 'successful', 'failed', 'skipped' counts
     """
     stats = {'total': 0, 'successful': 0, 'failed': 0, 'skipped': 0}
+    # Folders may have been removed since the last run
+    _created_dirs.clear()
 
+    is_dir = path.is_dir()
     if src_root is None:
-        src_root = path if path.is_dir() else path.parent
+        src_root = path if is_dir else path.parent
 
-    if path.is_file() and path.suffix.lower() == ".wpd":
+    if not is_dir and path.suffix.lower() == ".wpd" and path.is_file():
         stats['total'] = 1
-        result = convert_file(path, organize, dest_folder, retain_structure, src_root)
+        result = convert_file(path, organize, dest_folder, retain_structure, src_root, force)
         if result is True:
             stats['successful'] = 1
+        elif result == SKIPPED:
+            stats['skipped'] = 1
         elif result is False:
             stats['failed'] = 1
         if progress_callback:
-            progress_callback(1, 1)
-    elif path.is_dir():
-        finder = path.rglob if recursive else path.glob
+            progress_callback(1, 1, stats['failed'])
+    elif is_dir:
+        def wpd_files():
+            # Plain path strings from the walk; batches() only builds a Path
+            # for files that are actually queued for conversion.
+            if files is not None:
+                return map(os.fspath, files)
+            return _iter_wpd(path, recursive)
 
         # Pass 1: count (O(1) memory) — skip if caller already has the count
         if known_total > 0:
             stats['total'] = known_total
+        elif files is not None:
+            stats['total'] = len(files)
         else:
-            stats['total'] = sum(1 for _ in finder("*.wpd"))
+            stats['total'] = sum(1 for _ in wpd_files())
 
         if stats['total'] == 0:
             print("No .wpd files found.")
             return stats
 
-        lock = threading.Lock()
+        # Small jobs still get spread across every worker.
+        batch_size = max(1, min(BATCH_SIZE, -(-stats['total'] // max_workers)))
+
         processed = 0
+        provenance = {}  # output folder -> its PROVENANCE_FILE contents
+        changed = set()  # output folders whose provenance must be saved
+        inflight = {}  # output folder -> batches submitted but not yet recorded
+        left = set()  # output folders the walk has moved past
+
+        def provenance_for(out_dir: str) -> dict:
+            if out_dir not in provenance:
+                provenance[out_dir] = _load_provenance(out_dir)
+            return provenance[out_dir]
+
+        def release(out_dir: str):
+            # Once the walk has moved past a folder and its last batch is in,
+            # its provenance is saved and dropped, so only folders with work
+            # in flight are held in memory.
+            if out_dir in left and not inflight.get(out_dir):
+                if out_dir in changed:
+                    _save_provenance(out_dir, provenance[out_dir])
+                    changed.discard(out_dir)
+                provenance.pop(out_dir, None)
+                inflight.pop(out_dir, None)
+                left.discard(out_dir)
+
+        def report_progress():
+            if progress_callback:
+                progress_callback(processed, stats['total'], stats['failed'])
 
-        def run_one(wpd):
-            return wpd, convert_file(wpd, organize, dest_folder, retain_structure, src_root)
-
-        # Pass 2: parallel conversion (stream — no list materialised)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(run_one, wpd): wpd for wpd in finder("*.wpd")}
-            for future in as_completed(futures):
-                _, result = future.result()
-                with lock:
-                    if result is True:
-                        stats['successful'] += 1
+        def batches():
+            # The walk yields each folder's files together, so grouping
+            # consecutive files by output directory keeps batches full.
+            # Up-to-date files are dropped here, before they are queued, so
+            # batches hold only real work and no worker slot is spent on them.
+            nonlocal processed
+            # ``sigs`` holds each queued file's [mtime_ns, size], from the one
+            # stat taken here; it sizes timeouts and is what PROVENANCE_FILE records.
+            out_dir, batch, sigs, chars = None, [], [], 0
+            parent = target = target_str = None
+            listed, existing = None, set()  # .docx names already in ``listed``
+            # Outputs claimed in the current output folder. Two sources can
+            # map to the same .docx (x/a.wpd and y/a.wpd flattened into
+            # --dest, or a.wpd and a.WPD); only the first is converted so
+            # workers never write one file twice. An output folder's files
+            # arrive together, so claims are dropped when it changes.
+            claimed = {}
+            # Files settled here (skipped or refused). They are printed, and
+            # progress pushed, at each folder change, every REPORT_EVERY files
+            # and before each batch, so a mostly up-to-date tree still shows
+            # progress and the list stays small.
+            reports = []
+
+            def flush_reports():
+                nonlocal reports
+                if reports:
+                    _report_all(reports)
+                    report_progress()
+                    reports = []
+
+            for src in wpd_files():
+                if cancel is not None and cancel.is_set():
+                    # Skipped and refused files never reach the submit loop's
+                    # check, so the walk itself stops on a cancel; whatever
+                    # it hasn't reached is left as not started.
+                    flush_reports()
+                    return
+                # Files of a folder arrive together, so the destination (and
+                # its relative_to() arithmetic) is worked out once per folder.
+                folder, name = os.path.split(src)
+                if folder != parent:
+                    flush_reports()
+                    parent = folder
+                    target = output_dir_for(Path(src), organize, dest_folder, retain_structure, src_root)
+                    if os.fspath(target) != target_str:
+                        if target_str is not None:
+                            # The old folder's last batch is queued first, so
+                            # it counts as in flight and the folder is
+                            # released by its record(), not dropped before it.
+                            if batch:
+                                yield out_dir, batch, sigs
+                                batch, sigs, chars = [], [], 0
+                            left.add(target_str)
+                            release(target_str)
+                        target_str = os.fspath(target)
+                        claimed = {}
+                if target != out_dir:
+                    # Create each destination folder here, once, before its
+                    # first batch is queued, so workers never wait on mkdir.
+                    # A failure is reported per file by convert_batch.
+                    _make_output_dir(target)
+                if not force and target != listed:
+                    listed, existing = target, _existing_docx(target)
+                docx = os.path.splitext(name)[0] + ".docx"
+                key = _name_key(docx)
+                owner = claimed.setdefault(key, src)
+                if owner is not src:
+                    reports.append((src, f"failed - {docx} is already the output of {owner}"))
+                    stats['failed'] += 1
+                    processed += 1
+                    if len(reports) >= REPORT_EVERY:
+                        flush_reports()
+                    continue
+                # The only stat of the source: it decides freshness below and
+                # travels with the batch for the timeouts and provenance.
+                try:
+                    st = os.stat(src)
+                except OSError:
+                    st = None  # gone since the walk; soffice reports it
+                signature = [st.st_mtime_ns, st.st_size] if st else None
+                if not force and key in existing:
+                    known = provenance_for(target_str).get(os.path.abspath(src))
+                    if known is not None:
+                        fresh = known == signature
                     else:
-                        stats['failed'] += 1
+                        out_mtime = _mtime(os.path.join(target_str, docx))
+                        fresh = out_mtime is not None and st is not None and out_mtime >= st.st_mtime
+                else:
+                    fresh = False
+                if fresh:
+                    reports.append((src, "skipped - output file is up to date"))
+                    stats['skipped'] += 1
                     processed += 1
-                    current = processed
-                if progress_callback:
-                    progress_callback(current, stats['total'])
+                    if len(reports) >= REPORT_EVERY:
+                        flush_reports()
+                    continue
+                # Deeply nested paths can also fill the command line before
+                # the batch is full, so its length is capped as well.
+                size = len(src) + 1
+                if batch and (target != out_dir or len(batch) >= batch_size
+                              or chars + size > BATCH_ARGV_CHARS):
+                    flush_reports()
+                    yield out_dir, batch, sigs
+                    batch, sigs, chars = [], [], 0
+                out_dir = target
+                batch.append(Path(src))
+                sigs.append(signature)
+                chars += size
+            flush_reports()
+            if batch:
+                yield out_dir, batch, sigs
+
+        # Each worker thread keeps one LibreOffice listener (when python-uno
+        # is available) or one LibreOffice profile for all of its batches,
+        # so start-up is paid once per worker.
+        worker = threading.local()
+        profiles = []
+        servers = []
+
+        def run_batch(out_dir, batch, sigs):
+            if cancel is not None and cancel.is_set():
+                return None  # picked up after a cancel: not started
+            sizes = [sig[1] if sig else 0 for sig in sigs]
+            server = getattr(worker, "server", None)
+            if server and not server.running():
+                server.close()  # crashed; start a fresh listener for this worker
+                server = None
+            if server is None:
+                server = worker.server = _checkout_server() or False
+                if server:
+                    servers.append(server)
+            # batches() has already dropped up-to-date files, so
+            # convert_batch doesn't check them again (force=True).
+            if server:
+                return convert_batch(out_dir, batch, server=server, force=True, sizes=sizes)
+
+            profile = getattr(worker, "profile", None)
+            if profile is None or not profile.exists():
+                profile = worker.profile = Path(tempfile.mkdtemp(prefix="lo_worker_"))
+                profiles.append(profile)
+            return convert_batch(out_dir, batch, profile, force=True, sizes=sizes)
+
+        submitted = {}  # future -> (out_dir, batch, sigs)
+
+        def record(future):
+            nonlocal processed
+            out_dir, batch, sigs = submitted.pop(future)
+            folder = os.fspath(out_dir)
+            inflight[folder] -= 1
+            results = None if future.cancelled() else future.result()
+            if results is None:  # dropped by a cancel before it started
+                release(folder)
+                return
+            for wpd, signature, result in zip(batch, sigs, results):
+                if result is True:
+                    stats['successful'] += 1
+                    if signature:
+                        provenance_for(folder)[os.path.abspath(wpd)] = signature
+                        changed.add(folder)
+                elif result == SKIPPED:
+                    stats['skipped'] += 1
+                else:
+                    stats['failed'] += 1
+                processed += 1
+            release(folder)
+            report_progress()
+
+        # Pass 2: parallel batched conversion, streamed straight from the walk.
+        # At most two batches per worker are queued at a time, so conversion
+        # starts with the first batch found and memory stays bounded however
+        # large the tree is.
+        max_pending = max_workers * 2
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+
+                def cancelled() -> bool:
+                    # Queued batches are dropped; running ones can't be stopped
+                    if cancel is None or not cancel.is_set():
+                        return False
+                    for future in pending:
+                        future.cancel()
+                    return True
+
+                for out_dir, batch, sigs in batches():
+                    if cancelled():
+                        break
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record(future)
+                        if cancelled():  # may have been set during the wait
+                            break
+                    future = executor.submit(run_batch, out_dir, batch, sigs)
+                    submitted[future] = (out_dir, batch, sigs)
+                    folder = os.fspath(out_dir)
+                    inflight[folder] = inflight.get(folder, 0) + 1
+                    pending.add(future)
+                for future in as_completed(pending):
+                    cancelled()
+                    record(future)
+        finally:
+            # Folders still held are written here, so even a cancelled or
+            # failed run remembers what it did convert.
+            for folder in changed:
+                _save_provenance(folder, provenance[folder])
+            for server in servers:
+                _checkin_server(server)
+            for profile in profiles:
+                shutil.rmtree(profile, ignore_errors=True)
     else:
         print("No .wpd files found.")
 
@@ -264,15 +948,57 @@ def walk_and_convert(
 
 
 # ------------- GUI LAUNCHER -------------
+def _init_styles():
+    """Configure the ttk label styles used by the GUI (needs a Tk root)."""
+    from tkinter import ttk
+
+    style = ttk.Style()
+    style.configure("Title.TLabel", font=("", 14, "bold"))
+    style.configure("Header.TLabel", font=("", 12, "bold"))
+
+# Create a section frame with a header and content using ttk
+def create_section(parent, title, pady=(12, 6)):
+    """Create a titled section using ttk so text adopts system theme."""
+    import tkinter as tk
+    from tkinter import ttk
+
+    frame = tk.Frame(parent)
+    frame.pack(fill=tk.X, pady=pady)
+
+    # Top separator
+    ttk.Separator(frame, orient="horizontal").pack(fill=tk.X, pady=(0, 3))
+
+    # Title label (system text colour)
+    ttk.Label(frame, text=title, style="Header.TLabel").pack()
+
+    # Bottom separator
+    ttk.Separator(frame, orient="horizontal").pack(fill=tk.X, pady=(3, 6))
+
+    # Container for section content
+    content_frame = tk.Frame(frame)
+    content_frame.pack(fill=tk.X, padx=5, pady=2)
+    return content_frame
+
 def launch_gui():
     """
     Launch a simple Tkinter GUI that lets the user pick either
     a single .wpd file or a folder and optionally recurse into
     sub‑folders before converting to .docx.
     """
-    root = tk.Tk()
+    # Imported here so the CLI and the pywebview app (via api.py) never
+    # pay for loading Tk.
+    try:
+        import tkinter as tk
+        from tkinter import filedialog, messagebox
+        from tkinter import ttk
+
+        root = tk.Tk()
+    except Exception as e:  # Python built without Tk, or no display to open
+        print(f"Cannot open the GUI ({e}); using the terminal prompt instead.")
+        prompt_and_convert()
+        return
     root.title("WordPerfect → Word Converter")
-    ttk.Style().configure("Header.TLabel", font=("", 12, "bold"))
+    _init_styles()
     
     # Add padding around the entire window
     main_frame = tk.Frame(root, padx=20, pady=15)
@@ -282,6 +1008,8 @@ def launch_gui():
     dest_path = tk.StringVar()
     recurse = tk.BooleanVar(value=False)
     retain_structure = tk.BooleanVar(value=False)
+    force = tk.BooleanVar(value=False)
+    cancel_event = threading.Event()
     
     # Radio button variable for destination type
     destination_type = tk.StringVar(value="same")  # default: same location as source
@@ -342,10 +1070,9 @@ def launch_gui():
         selection_display.config(state=tk.DISABLED)
 
     def run_conversion():
-        ensure_soffice()  # try to auto‑locate LibreOffice
         # make sure LibreOffice (soffice) is available *after* GUI has loaded,
         # otherwise the app would exit before the window appears when launched
-        if SOFFICE is None:
+        if find_soffice() is None:  # try to auto‑locate LibreOffice
             # Create platform-specific installation message
             base_msg = "The converter needs LibreOffice. "
             if sys.platform == "darwin":  # macOS
@@ -386,32 +1113,81 @@ def launch_gui():
 
         # Disable button and reset progress bar
         convert_button.config(state=tk.DISABLED)
+        cancel_event.clear()
+        cancel_button.config(state=tk.NORMAL)
         progress_var.set(0)
         progress_label.config(text="")
 
-        def progress_callback(done, total):
-            pct = (done / total) * 100
-            root.after(0, lambda: progress_var.set(pct))
-            root.after(0, lambda: progress_label.config(text=f"{done}/{total} files"))
+        # Tk isn't thread-safe: the worker only posts to this queue and the
+        # main loop drains it every 100 ms, drawing just the latest progress.
+        updates = queue.Queue()
+
+        def progress_callback(done, total, failed):
+            updates.put(("progress", done, total, failed))
+
+        def poll_updates():
+            latest = None
+            try:
+                while True:
+                    update = updates.get_nowait()
+                    if update[0] == "done":
+                        on_done(update[1])
+                        return
+                    if update[0] == "error":
+                        convert_button.config(state=tk.NORMAL)
+                        cancel_button.config(state=tk.DISABLED)
+                        messagebox.showerror("Error", f"Conversion failed: {update[1]}")
+                        return
+                    latest = update
+            except queue.Empty:
+                pass
+            if latest:
+                _, done, total, failed = latest
+                progress_var.set((done / total) * 100)
+                progress_label.config(
+                    text=f"{done}/{total} files" + (f" ({failed} failed)" if failed else "")
+                    + (" – cancelling…" if cancel_event.is_set() else ""))
+            root.after(100, poll_updates)
+
+        # Read the Tk variables here, on the main thread
+        options = dict(
+            organize=organize_files,
+            dest_folder=dest_folder,
+            retain_structure=retain_structure.get(),
+            recursive=recurse.get(),
+            force=force.get(),
+        )
 
         def do_conversion():
-            stats = walk_and_convert(
-                path,
-                organize=organize_files,
-                dest_folder=dest_folder,
-                retain_structure=retain_structure.get(),
-                recursive=recurse.get(),
-                progress_callback=progress_callback,
-            )
-            root.after(0, lambda: on_done(stats))
+            try:
+                stats = walk_and_convert(path, progress_callback=progress_callback,
+                                         cancel=cancel_event, **options)
+            except Exception as e:
+                updates.put(("error", e))
+            else:
+                updates.put(("done", stats))
 
         def on_done(stats):
             convert_button.config(state=tk.NORMAL)
+            cancel_button.config(state=tk.DISABLED)
+            if cancel_event.is_set():
+                message = "Conversion cancelled.\n\n"
+                message += f"Successful: {stats['successful']}\n"
+                if stats['skipped'] > 0:
+                    message += f"Skipped (up to date): {stats['skipped']}\n"
+                if stats['failed'] > 0:
+                    message += f"Failed: {stats['failed']}\n"
+                not_started = stats['total'] - stats['successful'] - stats['skipped'] - stats['failed']
+                message += f"Not started: {not_started}\n"
+                messagebox.showinfo("Cancelled", message)
+                return
             progress_var.set(100)
             if stats['total'] > 0:
                 message = "Conversion complete!\n\n"
                 message += f"Total files: {stats['total']}\n"
                 message += f"Successful: {stats['successful']}\n"
+                if stats['skipped'] > 0:
+                    message += f"Skipped (up to date): {stats['skipped']}\n"
                 if stats['failed'] > 0:
                     message += f"Failed: {stats['failed']}\n"
                 messagebox.showinfo("Finished", message)
@@ -419,10 +1195,16 @@ def launch_gui():
                 messagebox.showinfo("Finished", "No .wpd files found to convert.")
 
         threading.Thread(target=do_conversion, daemon=True).start()
+        poll_updates()
+
+    def cancel_conversion():
+        # Batches already handed to LibreOffice finish; no new ones start.
+        cancel_event.set()
+        cancel_button.config(state=tk.DISABLED)
+        progress_label.config(text="Cancelling…")
 
     # ---------- UI layout ----------
     # Title section
-    ttk.Style().configure("Title.TLabel", font=("", 14, "bold"))
     title_label_text = "WordPerfect to Word Converter"
     title_label = ttk.Label(
         main_frame,
@@ -431,26 +1213,6 @@ def launch_gui():
     )
     title_label.pack(pady=(0, 15), anchor="center")
 
-    # Create a section frame with a header and content using ttk
-    def create_section(parent, title, pady=(12, 6)):
-        """Create a titled section using ttk so text adopts system theme."""
-        frame = tk.Frame(parent)
-        frame.pack(fill=tk.X, pady=pady)
-
-        # Top separator
-        ttk.Separator(frame, orient="horizontal").pack(fill=tk.X, pady=(0, 3))
-
-        # Title label (system text colour)
-        ttk.Label(frame, text=title, style="Header.TLabel").pack()
-
-        # Bottom separator
-        ttk.Separator(frame, orient="horizontal").pack(fill=tk.X, pady=(3, 6))
-
-        # Container for section content
-        content_frame = tk.Frame(frame)
-        content_frame.pack(fill=tk.X, padx=5, pady=2)
-        return content_frame
-    
     # 1. SOURCE SECTION
     source_frame = create_section(main_frame, "SOURCE FILES")
     
@@ -500,6 +1262,10 @@ def launch_gui():
                                        variable=retain_structure, command=update_selection_display, 
                                        state=tk.DISABLED)
     retain_structure_cb.pack(anchor="w", pady=3)
+
+    force_cb = tk.Checkbutton(dest_frame, text="Reconvert files that are already up to date",
+                              variable=force)
+    force_cb.pack(anchor="w", pady=2)
     
     # 3. SUMMARY SECTION
     summary_frame = create_section(main_frame, "SELECTION SUMMARY")
@@ -516,6 +1282,10 @@ def launch_gui():
                                font=("", 11, "bold"))
     convert_button.pack(pady=5)
 
+    cancel_button = tk.Button(action_frame, text="Cancel", command=cancel_conversion,
+                              width=20, state=tk.DISABLED)
+    cancel_button.pack()
+
     progress_var = tk.DoubleVar(value=0)
     ttk.Progressbar(action_frame, variable=progress_var, maximum=100,
                     mode='determinate', length=300).pack(pady=5)
@@ -524,48 +1294,93 @@ def launch_gui():
 
     # Initialize the display
     update_selection_display()
+    warm_soffice()
     root.mainloop()
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError("expects a number of at least 1")
+    return number
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Convert WordPerfect (.wpd) files to Word (.docx) with LibreOffice."
+    )
+    parser.add_argument("target", type=lambda p: Path(p).expanduser(),
+                        help=".wpd file or folder to convert")
+    parser.add_argument("--recursive", action="store_true",
+                        help="search sub-folders recursively")
+    parser.add_argument("--organize", action="store_true",
+                        help="place converted files in a 'Converted' subfolder")
+    parser.add_argument("--dest", type=lambda p: Path(p).expanduser(),
+                        help="custom destination folder")
+    parser.add_argument("--retain-structure", action="store_true",
+                        help="recreate the source folder structure under --dest")
+    parser.add_argument("--jobs", type=_positive_int, default=MAX_WORKERS,
+                        help=f"number of parallel LibreOffice workers (default {MAX_WORKERS})")
+    parser.add_argument("--force", action="store_true",
+                        help="reconvert even if the .docx is up to date")
+    return parser.parse_args(argv)
+
+
 def main():
     if len(sys.argv) > 1:                          # called from CLI → keep old behaviour
+        args = parse_args()
         ensure_soffice()
-        target = Path(sys.argv[1]).expanduser()
-        if not target.exists():
+        if not args.target.exists():
             sys.exit("Path does not exist.")
-        
-        # Use simple flags for CLI options
-        organize = "--organize" in sys.argv
-        recursive = "--recursive" in sys.argv  # New flag for recursive search
-        
-        # Check for destination folder parameter
-        dest_folder = None
-        retain_structure = False
-        
-        for i, arg in enumerate(sys.argv):
-            if arg == "--dest" and i+1 < len(sys.argv):
-                dest_folder = Path(sys.argv[i+1]).expanduser()
-            elif arg == "--retain-structure":
-                retain_structure = True
-        
+
         stats = walk_and_convert(
-            target, 
-            organize=organize, 
-            dest_folder=dest_folder, 
-            retain_structure=retain_structure,
-            recursive=recursive
+            args.target,
+            organize=args.organize,
+            dest_folder=args.dest,
+            retain_structure=args.retain_structure,
+            recursive=args.recursive,
+            max_workers=args.jobs,
+            force=args.force,
         )
         
-        # Print summary statistics
-        if stats['total'] > 0:
-            print(f"\nConversion Summary:")
-            print(f"Total files: {stats['total']}")
-            print(f"Successful: {stats['successful']}")
-            if stats['failed'] > 0:
-                print(f"Failed: {stats['failed']}")
-        else:
-            print("\nNo .wpd files found to convert.")
+        print_summary(stats)
     else:                                          # double‑clicked .app → show GUI first
         launch_gui()
 
+def print_summary(stats: dict):
+    """Print the statistics returned by walk_and_convert() for the terminal."""
+    if stats['total'] > 0:
+        print(f"\nConversion Summary:")
+        print(f"Total files: {stats['total']}")
+        print(f"Successful: {stats['successful']}")
+        if stats['skipped'] > 0:
+            print(f"Skipped (up to date): {stats['skipped']}")
+        if stats['failed'] > 0:
+            print(f"Failed: {stats['failed']}")
+    else:
+        print("\nNo .wpd files found to convert.")
+
+def prompt_and_convert():
+    """
+    Terminal fallback for launch_gui() when Tk can't be used: ask for the
+    file or folder to convert, then convert it like the CLI would.
+    """
+    try:
+        # Paths dragged into a terminal arrive quoted or with escaped spaces
+        answer = input("Path to a .wpd file or a folder of .wpd files: ").strip()
+        if not answer:
+            return
+        target = Path(answer.strip("'\"").replace("\\ ", " ")).expanduser()
+        if not target.exists():
+            sys.exit("Path does not exist.")
+        recursive = target.is_dir() and input("Search sub-folders too? [y/N] ").strip().lower() in ("y", "yes")
+    except (EOFError, KeyboardInterrupt):
+        print()
+        return
+    ensure_soffice()
+    print_summary(walk_and_convert(target, recursive=recursive))
+
 if __name__ == "__main__":
     main()